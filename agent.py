@@ -5,11 +5,30 @@ Instead of guessing which tools to use, the agent follows
 SOP workflows step-by-step.
 """
 
+import sys
+from collections import OrderedDict
 from typing import Dict, Any, List
 from sop import SOPManager
 from tools import TOOLS
 
 
+# Services we know how to pick out of a user query, in priority order
+COMMON_SERVICES = ("payment", "order", "logstash", "elasticsearch", "kafka")
+
+# Display symbol for each RFC 2119 requirement level of a step
+REQUIREMENT_SYMBOLS = {
+    'MUST': '🔴',
+    'SHOULD': '🟡',
+    'MAY': '🟢'
+}
+
+# Tools that take the service name from the user query as their argument
+SERVICE_ARG_TOOLS = frozenset({"search_service_errors"})
+
+# How many distinct queries to remember SOP matches for
+SOP_CACHE_SIZE = 256
+
+
 class AIOpsAgent:
     """
     Agent that follows SOPs to investigate issues.
@@ -18,10 +37,22 @@ class AIOpsAgent:
     the SOP tells it exactly which tools to use in which order.
     """
 
-    def __init__(self, sop_file: str = "sops.json"):
-        self.sop_manager = SOPManager(sop_file)
+    __slots__ = ("sop_manager", "tools", "conversation_history", "verbose",
+                 "_sop_cache", "_sop_cache_version")
+
+    def __init__(self, sop_file: str = "sops.json", verbose: bool = True):
+        self.sop_manager = SOPManager(sop_file, verbose=verbose)
         self.tools = TOOLS
         self.conversation_history = []
+        # When False, nothing is printed unless the SOP file fails to load
+        self.verbose = verbose
+        self._sop_cache = OrderedDict()
+        self._sop_cache_version = self.sop_manager.version
+
+    def _emit(self, lines: List[str]):
+        """Write a block of output lines in one go (silent if not verbose)."""
+        if self.verbose:
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def investigate(self, user_query: str) -> Dict[str, Any]:
         """
@@ -33,12 +64,14 @@ class AIOpsAgent:
         3. Execute tools as specified in each step
         4. Return findings
         """
-        print(f"\n{'='*70}")
-        print(f"User Query: {user_query}")
-        print(f"{'='*70}\n")
+        self._emit([
+            f"\n{'='*70}",
+            f"User Query: {user_query}",
+            f"{'='*70}\n",
+        ])
 
         # Step 1: Find matching SOP
-        sop = self.sop_manager.find_sop(user_query)
+        sop = self._find_sop(user_query)
 
         if not sop:
             return {
@@ -47,17 +80,20 @@ class AIOpsAgent:
                 "suggestion": "Create an SOP for this scenario to guide future investigations."
             }
 
-        print(f"✓ Matched SOP: {sop.name}")
-        print(f"  Description: {sop.description}")
-        print(f"  Steps: {len(sop.steps)}")
+        lines = [
+            f"✓ Matched SOP: {sop.name}",
+            f"  Description: {sop.description}",
+            f"  Steps: {len(sop.steps)}",
+        ]
 
         # Show "do not" actions if present
         if hasattr(sop, 'do_not') and sop.do_not:
-            print(f"\n  ⚠️  Actions to Avoid:")
+            lines.append(f"\n  ⚠️  Actions to Avoid:")
             for item in sop.do_not:
-                print(f"    {item['requirement']}: {item['action']}")
-                print(f"      Reason: {item['reason']}")
-        print()
+                lines.append(f"    {item['requirement']}: {item['action']}")
+                lines.append(f"      Reason: {item['reason']}")
+        lines.append("")
+        self._emit(lines)
 
         # Step 2: Execute SOP workflow
         results = self._execute_sop_workflow(sop, user_query)
@@ -69,6 +105,27 @@ class AIOpsAgent:
             "results": results
         }
 
+    def _find_sop(self, user_query: str):
+        """
+        Find the matching SOP, reusing the result for repeated queries.
+        Matching is case-insensitive, so the lowercased query is the key.
+        The cache is dropped whenever the SOP manager reloads its SOPs.
+        """
+        if self._sop_cache_version != self.sop_manager.version:
+            self._sop_cache.clear()
+            self._sop_cache_version = self.sop_manager.version
+
+        key = user_query.lower()
+        if key in self._sop_cache:
+            self._sop_cache.move_to_end(key)
+            return self._sop_cache[key]
+
+        sop = self.sop_manager.find_sop(key)
+        self._sop_cache[key] = sop
+        if len(self._sop_cache) > SOP_CACHE_SIZE:
+            self._sop_cache.popitem(last=False)
+        return sop
+
     def _execute_sop_workflow(self, sop, user_query: str) -> Dict[str, Any]:
         """
         Execute the SOP workflow step by step.
@@ -84,56 +141,65 @@ class AIOpsAgent:
         }
 
         for step_data in sop.steps:
+            step_number = step_data["step"]
+            action = step_data["action"]
+            tool_names = step_data["tools"]
+            check_for = step_data.get("check_for")
+            if_found = step_data.get("if_found")
+
             requirement = step_data.get('requirement', 'SHOULD')
-            req_symbol = {
-                'MUST': '🔴',
-                'SHOULD': '🟡',
-                'MAY': '🟢'
-            }.get(requirement, '⚪')
+            req_symbol = REQUIREMENT_SYMBOLS.get(requirement, '⚪')
 
-            print(f"\nStep {step_data['step']} [{req_symbol} {requirement}]: {step_data['action']}")
-            print(f"  Tools: {', '.join(step_data['tools'])}")
+            # Collect the step's output; it is written before each tool
+            # runs (so progress shows up) and once more at the end
+            lines = [
+                f"\nStep {step_number} [{req_symbol} {requirement}]: {action}",
+                f"  Tools: {', '.join(tool_names)}",
+            ]
 
             # Execute tools for this step
             step_results = []
-            for tool_name in step_data["tools"]:
-                if tool_name in self.tools:
-                    print(f"  → Executing {tool_name}...")
+            for tool_name in tool_names:
+                tool_func = self.tools.get(tool_name)
+                if tool_func is not None:
+                    lines.append(f"  → Executing {tool_name}...")
+                    self._emit(lines)
+                    lines = []
 
                     # Execute tool
-                    tool_func = self.tools[tool_name]
                     try:
                         # Handle tools with different signatures
-                        if "service_errors" in tool_name:
+                        if tool_name in SERVICE_ARG_TOOLS:
                             # Extract service name from query
                             result = tool_func(self._extract_service(user_query))
                         else:
                             result = tool_func()
 
                         step_results.append(result)
-                        print(f"    ✓ {tool_name} completed")
+                        lines.append(f"    ✓ {tool_name} completed")
                     except Exception as e:
-                        print(f"    ✗ Error executing {tool_name}: {e}")
+                        lines.append(f"    ✗ Error executing {tool_name}: {e}")
                         step_results.append({"error": str(e)})
                 else:
-                    print(f"  ⚠ Tool not found: {tool_name}")
+                    lines.append(f"  ⚠ Tool not found: {tool_name}")
 
             # Check what was found
-            if step_data.get("check_for"):
-                print(f"  Looking for: {step_data['check_for']}")
+            if check_for:
+                lines.append(f"  Looking for: {check_for}")
 
             # Check condition for next step
-            if step_data.get("if_found"):
-                print(f"  Next: {step_data['if_found']}")
+            if if_found:
+                lines.append(f"  Next: {if_found}")
 
             workflow_results["steps"].append({
-                "step": step_data["step"],
-                "action": step_data["action"],
-                "tools_used": step_data["tools"],
+                "step": step_number,
+                "action": action,
+                "tools_used": list(tool_names),
                 "results": step_results
             })
 
-            print()
+            lines.append("")
+            self._emit(lines)
 
         return workflow_results
 
@@ -142,10 +208,9 @@ class AIOpsAgent:
         Extract service name from query.
         Simple keyword extraction for demo.
         """
-        common_services = ["payment", "order", "logstash", "elasticsearch", "kafka"]
         query_lower = query.lower()
 
-        for service in common_services:
+        for service in COMMON_SERVICES:
             if service in query_lower:
                 return service
 
@@ -163,12 +228,13 @@ class AIOpsAgent:
 
         while True:
             user_input = input("You: ").strip()
+            command = user_input.lower()
 
-            if user_input.lower() == 'quit':
+            if command == 'quit':
                 print("Goodbye!")
                 break
 
-            if user_input.lower() == 'list':
+            if command == 'list':
                 self.sop_manager.list_sops()
                 continue
 
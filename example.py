@@ -6,12 +6,14 @@ from agent import AIOpsAgent
 
 
 def main():
-    print("\n" + "="*70)
-    print(" AIOps Agent with SOP Guidance - Example")
-    print("="*70)
-    print()
-    print("This demonstrates how SOPs guide the agent to use the right tools")
-    print("in the right order, instead of the agent guessing.\n")
+    print("\n".join([
+        "\n" + "="*70,
+        " AIOps Agent with SOP Guidance - Example",
+        "="*70,
+        "",
+        "This demonstrates how SOPs guide the agent to use the right tools",
+        "in the right order, instead of the agent guessing.\n",
+    ]))
 
     # Create agent
     agent = AIOpsAgent()
@@ -24,30 +26,30 @@ def main():
     ]
 
     for i, query in enumerate(queries, 1):
-        print(f"\n{'#'*70}")
-        print(f"# Example {i}")
-        print(f"{'#'*70}\n")
+        print(f"\n{'#'*70}\n# Example {i}\n{'#'*70}\n")
 
         result = agent.investigate(query)
 
         if result["status"] == "success":
-            print(f"✓ Investigation guided by SOP: {result['sop_used']}")
-            print(f"✓ Executed {result['steps_executed']} steps systematically")
+            print(f"✓ Investigation guided by SOP: {result['sop_used']}\n"
+                  f"✓ Executed {result['steps_executed']} steps systematically")
         else:
             print(f"⚠ {result['message']}")
 
         input("\nPress Enter for next example...")
 
-    print("\n" + "="*70)
-    print(" Example Complete")
-    print("="*70)
-    print()
-    print("Key Points:")
-    print("  • SOPs tell the agent exactly which tools to use")
-    print("  • Tools are executed in a specific order")
-    print("  • No guessing - clear workflow every time")
-    print("  • Easy to add new SOPs for new scenarios")
-    print()
+    print("\n".join([
+        "\n" + "="*70,
+        " Example Complete",
+        "="*70,
+        "",
+        "Key Points:",
+        "  • SOPs tell the agent exactly which tools to use",
+        "  • Tools are executed in a specific order",
+        "  • No guessing - clear workflow every time",
+        "  • Easy to add new SOPs for new scenarios",
+        "",
+    ]))
 
 
 if __name__ == "__main__":
@@ -6,7 +6,28 @@ instead of letting the agent guess.
 """
 
 import json
-from typing import List, Dict, Any, Optional
+import os
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    # Optional: faster JSON parsing when orjson is installed
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Parsed SOP data per file, reused while the file is unchanged:
+# absolute path -> ((mtime_ns, size), sop dicts)
+_loaded_sops: Dict[str, Tuple[Tuple[int, int], Tuple[Dict[str, Any], ...]]] = {}
+
+
+def _copy_readonly(value: Any) -> Any:
+    """Copy parsed JSON data, turning lists into tuples."""
+    if isinstance(value, dict):
+        return {key: _copy_readonly(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return tuple(_copy_readonly(item) for item in value)
+    return value
 
 
 class SOP:
@@ -20,24 +41,35 @@ class SOP:
     - What to look for in results
     """
 
+    __slots__ = ("id", "name", "description", "triggers", "steps", "do_not",
+                 "_triggers_lower")
+
     def __init__(self, data: Dict[str, Any]):
         self.id = data["id"]
         self.name = data["name"]
         self.description = data["description"]
-        self.triggers = data.get("triggers", [])
-        self.steps = data["steps"]
-        self.do_not = data.get("do_not", [])
+        # SOPs are read-only once loaded, so keep the sequences as tuples.
+        # Steps and do_not entries are copied so that no SOP shares them
+        # with the load cache or with another manager's SOPs.
+        self.triggers = tuple(data.get("triggers", ()))
+        self.steps = _copy_readonly(data["steps"])
+        self.do_not = _copy_readonly(data.get("do_not", []))
+
+        # Matching is case-insensitive, so lowercase the triggers once here
+        self._triggers_lower = tuple(trigger.lower() for trigger in self.triggers)
 
     def matches(self, user_query: str) -> bool:
         """
         Check if this SOP matches the user query.
         Simple keyword-based matching for now.
         """
-        query_lower = user_query.lower()
+        return self._matches_lower(user_query.lower())
 
+    def _matches_lower(self, query_lower: str) -> bool:
+        """Same as matches(), for a query that is already lowercased."""
         # Check if any trigger phrase is in the query
-        for trigger in self.triggers:
-            if trigger.lower() in query_lower:
+        for trigger in self._triggers_lower:
+            if trigger in query_lower:
                 return True
 
         return False
@@ -56,39 +88,69 @@ class SOP:
 class SOPManager:
     """Manages SOPs - loading, searching, matching."""
 
-    def __init__(self, sop_file: str = "sops.json"):
+    __slots__ = ("sop_file", "sops", "version", "verbose")
+
+    def __init__(self, sop_file: str = "sops.json", verbose: bool = True):
         self.sop_file = sop_file
+        # When False, only problems loading the SOP file are printed
+        self.verbose = verbose
         self.sops: List[SOP] = []
+        # Bumped on every (re)load so callers can invalidate cached matches
+        self.version = 0
         self.load_sops()
 
     def load_sops(self):
-        """Load SOPs from JSON file."""
+        """
+        Load SOPs from JSON file.
+        The file is only parsed again if its mtime or size changed since it
+        was last loaded (a same-size rewrite within the filesystem's
+        timestamp granularity is not noticed). Each call builds new SOP
+        objects, so managers never share them.
+        """
         try:
-            with open(self.sop_file, 'r') as f:
-                data = json.load(f)
-                self.sops = [SOP(sop_data) for sop_data in data.get("sops", [])]
-            print(f"✓ Loaded {len(self.sops)} SOPs")
+            path = os.path.abspath(self.sop_file)
+            stat = os.stat(path)
+            version = (stat.st_mtime_ns, stat.st_size)
+
+            cached = _loaded_sops.get(path)
+            if cached and cached[0] == version:
+                sops_data = cached[1]
+            else:
+                if orjson is not None:
+                    with open(path, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(path, 'r') as f:
+                        data = json.load(f)
+                sops_data = tuple(data.get("sops", []))
+                _loaded_sops[path] = (version, sops_data)
+            self.sops = [SOP(sop_data) for sop_data in sops_data]
+            if self.verbose:
+                print(f"✓ Loaded {len(self.sops)} SOPs")
         except FileNotFoundError:
             print(f"⚠ SOP file not found: {self.sop_file}")
             self.sops = []
         except Exception as e:
             print(f"✗ Error loading SOPs: {e}")
             self.sops = []
+        self.version += 1
 
     def find_sop(self, user_query: str) -> Optional[SOP]:
         """
         Find the best matching SOP for a user query.
         Returns the first match for simplicity.
         """
+        query_lower = user_query.lower()
         for sop in self.sops:
-            if sop.matches(user_query):
+            if sop._matches_lower(query_lower):
                 return sop
         return None
 
     def list_sops(self):
         """List all available SOPs."""
-        print("\nAvailable SOPs:")
+        lines = ["\nAvailable SOPs:"]
         for i, sop in enumerate(self.sops, 1):
-            print(f"{i}. {sop.name}")
-            print(f"   Triggers: {', '.join(sop.triggers)}")
-            print(f"   Steps: {len(sop.steps)}")
+            lines.append(f"{i}. {sop.name}")
+            lines.append(f"   Triggers: {', '.join(sop.triggers)}")
+            lines.append(f"   Steps: {len(sop.steps)}")
+        print("\n".join(lines))